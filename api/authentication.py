@@ -0,0 +1,27 @@
+import hashlib
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+
+TOKEN_CACHE_TIMEOUT = 60
+
+
+def token_cache_key(key):
+    # Keeps tokens out of key listings; the cached (user, token) value still
+    # holds the token and the user's password hash
+    return 'token:' + hashlib.sha256(key.encode()).hexdigest()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that caches the (user, token) pair, so a token is
+    looked up in the database once per TOKEN_CACHE_TIMEOUT instead of on
+    every request. See api/signals.py for invalidation.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        credentials = cache.get(cache_key)
+        if credentials is None:
+            credentials = super().authenticate_credentials(key)
+            cache.set(cache_key, credentials, TOKEN_CACHE_TIMEOUT)
+        return credentials
@@ -0,0 +1,27 @@
+import threading
+import time
+from django.core.cache import cache
+
+CUSTOMERS_CACHE_KEY = 'customers:published'
+CUSTOMERS_CACHE_VERSION_KEY = 'customers:published:version'
+CUSTOMERS_CACHE_TIMEOUT = 300
+customers_cache_lock = threading.Lock()
+
+
+def customers_cache_key():
+    """
+    Returns the key of the current list version. Readers take it before
+    querying, so a list built from rows read before a write is stored under a
+    version nobody reads again instead of overwriting the invalidation.
+    """
+    # A fresh timestamp rather than 1, so an evicted version key cannot
+    # resurrect lists cached under an earlier version
+    version = cache.get_or_set(CUSTOMERS_CACHE_VERSION_KEY, time.time_ns, None)
+    return '{}:{}'.format(CUSTOMERS_CACHE_KEY, version)
+
+
+def invalidate_customers_cache():
+    try:
+        cache.incr(CUSTOMERS_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(CUSTOMERS_CACHE_VERSION_KEY, time.time_ns(), None)
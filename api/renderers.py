@@ -0,0 +1,21 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson. Types orjson does not support natively
+    (Decimal, lazy translation strings, ...) fall back to DRF's JSONEncoder.
+    """
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # Non-string keys occur in DRF's errors for many=True serializers
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        # orjson only supports two space indentation
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=self.encoder.default, option=option)
@@ -0,0 +1,35 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from api.authentication import token_cache_key
+from api.cache import invalidate_customers_cache
+from business.models import Customer
+
+
+@receiver(post_delete, sender=Token)
+def forget_deleted_token(sender, instance, **kwargs):
+    # Evict after the commit, or a concurrent request re-caches the row
+    cache_key = token_cache_key(instance.key)
+    transaction.on_commit(lambda: cache.delete(cache_key))
+
+
+@receiver(post_save, sender=get_user_model())
+def forget_user_token(sender, instance, created, **kwargs):
+    # Deactivated users must not stay authenticated until the cache expires
+    if not created:
+        cache_keys = [token_cache_key(key) for key in
+                      Token.objects.filter(user=instance).values_list('key', flat=True)]
+        if cache_keys:
+            transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
+
+@receiver(post_save, sender=Customer)
+@receiver(post_delete, sender=Customer)
+def forget_customers_list(sender, **kwargs):
+    # Covers every writer, including the admin, not only the API views. Wait
+    # for the commit, or a concurrent reader can cache the old rows under the
+    # new version
+    transaction.on_commit(invalidate_customers_cache)
@@ -0,0 +1,63 @@
+from django.urls import reverse
+from django.core.cache import cache
+from django.contrib.auth.models import User
+from django.db import transaction
+from rest_framework.test import APITestCase, APITransactionTestCase
+from rest_framework.authtoken.models import Token
+from rest_framework import status
+from api.authentication import token_cache_key
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    customers_url = reverse("customer")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='admin', password='admin')
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def test_deleted_token_is_rejected(self):
+        response = self.client.get(self.customers_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.token.delete()
+        response = self.client.get(self.customers_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_is_rejected(self):
+        response = self.client.get(self.customers_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        response = self.client.get(self.customers_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cache_key_does_not_contain_token(self):
+        self.assertNotIn(self.token.key, token_cache_key(self.token.key))
+
+
+class CachedTokenRevocationTransactionTests(APITransactionTestCase):
+    customers_url = reverse("customer")
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='admin', password='admin')
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def test_token_is_evicted_on_commit(self):
+        self.client.get(self.customers_url)
+        cache_key = token_cache_key(self.token.key)
+        with transaction.atomic():
+            self.token.delete()
+            self.assertIsNotNone(cache.get(cache_key))
+        self.assertIsNone(cache.get(cache_key))
+        response = self.client.get(self.customers_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
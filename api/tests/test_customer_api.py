@@ -1,11 +1,17 @@
 from django.urls import path, reverse, include, resolve
 from django.test import SimpleTestCase
 from api.views import CustomerView
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase, APITransactionTestCase, APIClient
 from rest_framework.authtoken.models import Token
 from rest_framework import status
 from django.contrib.auth.models import User
 from rest_framework.views import APIView
+from business.models import Customer
+from django.core.cache import cache
+from django.db import transaction
+from unittest import mock
+from api.cache import customers_cache_key
+from api.serializers import MAX_BULK_CREATE
 
 
 class ApiUrlsTests(SimpleTestCase):
@@ -18,17 +24,128 @@ class ApiUrlsTests(SimpleTestCase):
 class CustomerAPIViewTests(APITestCase):
     customers_url = reverse("customer")
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='admin', password='admin')
-        self.token = Token.objects.create(user=self.user)
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
         #self.client = APIClient()
         self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        cache.clear()
 
     def test_get_customers_authenticated(self):
         response = self.client.get(self.customers_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_get_customers_query_count_is_constant(self):
+        for i in range(5):
+            Customer.objects.create(
+                title="Mr", name="Peter{}".format(i), last_name="Parker",
+                gender="M", status="published", created_by=self.user)
+        # One query for the token lookup and one for the customer list
+        with self.assertNumQueries(2):
+            response = self.client.get(self.customers_url)
+        self.assertEqual(len(response.data), 5)
+
+    def test_get_customers_sees_orm_writes(self):
+        self.client.get(self.customers_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            customer = Customer.objects.create(
+                title="Mr", name="Peter", last_name="Parker",
+                gender="M", status="draft", created_by=self.user)
+        response = self.client.get(self.customers_url)
+        self.assertEqual(len(response.data), 0)
+
+        customer.status = "published"
+        with self.captureOnCommitCallbacks(execute=True):
+            customer.save()
+        response = self.client.get(self.customers_url)
+        self.assertEqual(len(response.data), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            customer.delete()
+        response = self.client.get(self.customers_url)
+        self.assertEqual(len(response.data), 0)
+
+    def test_get_customers_does_not_cache_rows_read_before_a_write(self):
+        rows = list(Customer.published.all())
+
+        def stale_queryset():
+            # A write lands after this request read its rows
+            Customer.objects.create(
+                title="Mr", name="Peter", last_name="Parker",
+                gender="M", status="published", created_by=self.user)
+            return rows
+
+        # The write commits once the request has cached what it read
+        with self.captureOnCommitCallbacks(execute=True), \
+                mock.patch.object(CustomerView, 'get_queryset', side_effect=stale_queryset):
+            response = self.client.get(self.customers_url)
+        self.assertEqual(len(response.data), 0)
+        response = self.client.get(self.customers_url)
+        self.assertEqual(len(response.data), 1)
+
+    def test_post_customers_list_authenticated(self):
+        data = [
+            {"title": "Mr", "name": "Peter", "last_name": "Parker",
+             "gender": "M", "status": "published"},
+            {"title": "Mrs", "name": "Mary", "last_name": "Jane",
+             "gender": "F", "status": "published"},
+        ]
+        response = self.client.post(self.customers_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 2)
+        self.assertIsNotNone(response.data[0]['id'])
+        self.assertEqual(Customer.published.count(), 2)
+
+    def test_post_customers_list_with_invalid_item(self):
+        data = [
+            {"title": "Mr", "name": "Peter", "last_name": "Parker",
+             "gender": "M", "status": "published"},
+            {"title": "Mrs", "name": "Mary", "last_name": "Jane",
+             "gender": "X", "status": "published"},
+        ]
+        response = self.client.post(self.customers_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # Errors are reported per index of the offending item
+        self.assertEqual(list(response.data[1]), ['gender'])
+        self.assertNotIn(0, response.data)
+        self.assertEqual(Customer.objects.count(), 0)
+
+    def test_post_customers_list_too_long(self):
+        item = {"title": "Mr", "name": "Peter", "last_name": "Parker",
+                "gender": "M", "status": "published"}
+        data = [item] * (MAX_BULK_CREATE + 1)
+        response = self.client.post(self.customers_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Customer.objects.count(), 0)
+
+    def test_post_customers_list_of_non_objects(self):
+        response = self.client.post(self.customers_url, [1, 2], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Customer.objects.count(), 0)
+
+    def test_get_customers_is_cached_until_post(self):
+        self.client.get(self.customers_url)
+        # Neither the token nor the list hit the database once cached
+        with self.assertNumQueries(0):
+            response = self.client.get(self.customers_url)
+        self.assertEqual(len(response.data), 0)
+
+        data = {
+            "title": "Mr",
+            "name": "Peter",
+            "last_name": "Parkerz",
+            "gender": "M",
+            "status": "published"
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.customers_url, data, format='json')
+        response = self.client.get(self.customers_url)
+        self.assertEqual(len(response.data), 1)
+
     def test_get_customers_un_authenticated(self):
         self.client.force_authenticate(user=None, token=None)
         response = self.client.get(self.customers_url)
@@ -47,27 +164,53 @@ class CustomerAPIViewTests(APITestCase):
         self.assertEqual(len(response.data), 8)
 
 
-class CustomerDetailAPIViewTests(APITestCase):
-    customer_url = reverse('customer-detail', args=[1])
+class CustomerListCacheTransactionTests(APITransactionTestCase):
     customers_url = reverse("customer")
 
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             username='admin', password='admin')
         self.token = Token.objects.create(user=self.user)
-        #self.client = APIClient()
         self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
 
+    def test_cache_is_invalidated_on_commit(self):
+        self.client.get(self.customers_url)
+        key = customers_cache_key()
+        with transaction.atomic():
+            Customer.objects.create(
+                title="Mr", name="Peter", last_name="Parker",
+                gender="M", status="published", created_by=self.user)
+            # Readers before the commit still see the old rows, so the
+            # version must not move yet
+            self.assertEqual(customers_cache_key(), key)
+        self.assertNotEqual(customers_cache_key(), key)
+        response = self.client.get(self.customers_url)
+        self.assertEqual(len(response.data), 1)
+
+
+class CustomerDetailAPIViewTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='admin', password='admin')
+        cls.token = Token.objects.create(user=cls.user)
+
         # Saving customer
-        data = {
-            "title": "Mrs",
-            "name": "Johnson",
-            "last_name": "MOrisee",
-            "gender": "F",
-            "status": "published"
-        }
-        self.client.post(
-            self.customers_url, data, format='json')
+        cls.customer = Customer.published.create(
+            title="Mrs",
+            name="Johnson",
+            last_name="MOrisee",
+            gender="F",
+            status="published",
+            created_by=cls.user
+        )
+        cls.customer_url = reverse('customer-detail', args=[cls.customer.pk])
+
+    def setUp(self):
+        #self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
 
     def test_get_customer_autheticated(self):
         response = self.client.get(self.customer_url)
@@ -79,6 +222,10 @@ class CustomerDetailAPIViewTests(APITestCase):
         response = self.client.get(self.customer_url)
         self.assertEqual(response.status_code, 401)
 
+    def test_get_customer_not_found(self):
+        response = self.client.get(reverse('customer-detail', args=[999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_delete_customer_authenticated(self):
         response = self.client.delete(self.customer_url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
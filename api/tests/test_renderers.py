@@ -0,0 +1,30 @@
+from decimal import Decimal
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.exceptions import ErrorDetail
+from api.renderers import OrjsonRenderer
+
+
+class OrjsonRendererTests(SimpleTestCase):
+
+    def test_render_matches_json_renderer(self):
+        data = {'name': 'Peter', 'customers': [1, 2], 'active': True}
+        self.assertEqual(OrjsonRenderer().render(data), JSONRenderer().render(data))
+
+    def test_render_falls_back_to_drf_encoder(self):
+        data = {'amount': Decimal('1.50'), 'message': gettext_lazy('Not Found')}
+        self.assertEqual(OrjsonRenderer().render(data), JSONRenderer().render(data))
+
+    def test_render_non_string_keys(self):
+        data = {1: {'gender': [ErrorDetail('"X" is not a valid choice.', code='invalid_choice')]}}
+        self.assertEqual(OrjsonRenderer().render(data), JSONRenderer().render(data))
+
+    def test_render_indented(self):
+        data = {'name': 'Peter', 'customers': [1, 2]}
+        media_type = 'application/json; indent=2'
+        self.assertEqual(OrjsonRenderer().render(data, media_type),
+                         JSONRenderer().render(data, media_type))
+
+    def test_render_none(self):
+        self.assertEqual(OrjsonRenderer().render(None), b'')
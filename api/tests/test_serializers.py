@@ -0,0 +1,11 @@
+from django.test import SimpleTestCase
+from api.serializers import CustomerSerializer
+
+
+class CustomerSerializerTests(SimpleTestCase):
+
+    def test_fields_are_copied_per_instance(self):
+        first, second = CustomerSerializer(), CustomerSerializer()
+        self.assertEqual(list(first.fields), list(second.fields))
+        self.assertIsNot(first.fields['name'], second.fields['name'])
+        self.assertIs(first.fields['name'].parent, first)
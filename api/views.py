@@ -1,63 +1,74 @@
-from django.shortcuts import render
+from django.shortcuts import get_object_or_404
 from rest_framework.views import APIView
+from rest_framework import generics
 from rest_framework.response import Response
 from business.models import Customer
 from api.serializers import CustomerSerializer
 from rest_framework import status
-from django.http import Http404
-from functools import wraps
+from rest_framework.serializers import ListSerializer
 from rest_framework.permissions import IsAuthenticated
+from django.core.cache import cache
+from django.db import transaction
+from api.cache import (
+    CUSTOMERS_CACHE_TIMEOUT, customers_cache_key, customers_cache_lock,
+    invalidate_customers_cache)
 
 
-class CustomerView(APIView):
+class CustomerView(generics.ListCreateAPIView):
     permission_classes = (IsAuthenticated,)
+    serializer_class = CustomerSerializer
 
-    def get(self, request, format=None):
-        customers = Customer.published.all()
-        serializer = CustomerSerializer(customers, many=True)
-        return Response(serializer.data)
+    def get_queryset(self):
+        return CustomerSerializer.setup_eager_loading(Customer.published.all())
 
-    def post(self, request, format=None):
-        serializer = CustomerSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    def get_serializer(self, *args, **kwargs):
+        # Accept a list of customers in a single POST
+        if isinstance(kwargs.get('data'), list):
+            kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
 
+    def list(self, request, *args, **kwargs):
+        # Cache the serialized list; api/signals.py invalidates it on writes
+        data = cache.get(customers_cache_key())
+        if data is None:
+            # Concurrent misses wait for the first request to fill the cache
+            # instead of all running the same query. This only coalesces under
+            # threaded WSGI servers; under ASGI sync views already run one at a
+            # time per worker
+            with customers_cache_lock:
+                key = customers_cache_key()
+                data = cache.get(key)
+                if data is None:
+                    data = self.get_serializer(self.get_queryset(), many=True).data
+                    cache.set(key, data, CUSTOMERS_CACHE_TIMEOUT)
+        return Response(data)
 
-def resource_checker(model):
-    def check_entity(fun):
-        @wraps(fun)
-        def inner_fun(*args, **kwargs):
-            try:
-                x = fun(*args, **kwargs)
-                return x
-            except model.DoesNotExist:
-                return Response({'message': 'Not Found'}, status=status.HTTP_204_NO_CONTENT)
-        return inner_fun
-    return check_entity
+    def perform_create(self, serializer):
+        serializer.save()
+        # bulk_create sends no post_save signals
+        if isinstance(serializer, ListSerializer):
+            transaction.on_commit(invalidate_customers_cache)
 
 
 class CustomerDetailView(APIView):
     permission_classes = (IsAuthenticated,)
 
-    @resource_checker(Customer)
     def get(self, request, pk, format=None):
-        customer = Customer.published.get(pk=pk)
+        customer = get_object_or_404(
+            CustomerSerializer.setup_eager_loading(Customer.published.all()), pk=pk)
         serializer = CustomerSerializer(customer)
         return Response(serializer.data)
 
-    @resource_checker(Customer)
     def put(self, request, pk, format=None):
-        customer = Customer.published.get(pk=pk)
+        customer = get_object_or_404(
+            CustomerSerializer.setup_eager_loading(Customer.published.all()), pk=pk)
         serializer = CustomerSerializer(customer, data=request.data)
         if serializer.is_valid():
             serializer.save()
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    @resource_checker(Customer)
     def delete(self, request, pk, format=None):
-        customer = Customer.published.get(pk=pk)
+        customer = get_object_or_404(Customer.published, pk=pk)
         customer.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,11 +1,19 @@
 from django.contrib import admin
+from django.db.models import CharField, Value
+from django.db.models.functions import Concat
 from .models import Customer
 
 class CustomerAdmin(admin.ModelAdmin):
     list_display = ('title', 'full_name','gender', 'status', 'created_by', 'created',)
     readonly_fields = ('created', )
 
+    def get_queryset(self, request):
+        # Let the database build full_name instead of formatting it per row
+        return super().get_queryset(request).annotate(
+            full_name=Concat('name', Value(' '), 'last_name', output_field=CharField()))
+
+    @admin.display(ordering='full_name')
     def full_name(self, obj):
-        return obj.name + " " +obj.last_name
+        return obj.full_name
 
-admin.site.register(Customer,CustomerAdmin)
\ No newline at end of file
+admin.site.register(Customer,CustomerAdmin)